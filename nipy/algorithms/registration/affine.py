@@ -43,7 +43,15 @@ def rotation_vec2mat(r):
     """
     R = rotation_vec2mat(r)
 
-    The rotation matrix is given by the Rodrigues formula:
+    The rotation matrix is computed in closed form from the unit
+    quaternion (a, b, c, d) = (cos(theta/2), sin(theta/2)*n):
+
+          a2+b2-c2-d2    2(bc-ad)      2(bd+ac)
+    R =   2(bc+ad)       a2-b2+c2-d2   2(cd-ab)
+          2(bd-ac)       2(cd+ab)      a2-b2-c2+d2
+
+    where theta = ||r|| and n = r / theta. This is the same matrix as
+    given by the Rodrigues formula:
 
     R = Id + sin(theta)*Sn + (1-cos(theta))*Sn^2
 
@@ -53,17 +61,11 @@ def rotation_vec2mat(r):
     Sn =   nz   0 -nx
           -ny  nx   0
 
-    where n = r / ||r||
-
-    In case the angle ||r|| is very small, the above formula may lead
-    to numerical instabilities. We instead use a Taylor expansion
-    around theta=0:
-
-    R = I + sin(theta)/tetha Sr + (1-cos(theta))/teta2 Sr^2
-
-    leading to:
+    In case the angle ||r|| is very small, computing sin(theta/2)/theta
+    may lead to numerical instabilities. We instead use a Taylor
+    expansion around theta=0:
 
-    R = I + (1-theta2/6)*Sr + (1/2-theta2/24)*Sr^2
+    sin(theta/2)/theta = 1/2 - theta2/48
 
     To avoid numerical instabilities, an upper threshold is applied to
     the angle. It is chosen to be a multiple of 2*pi, hence the
@@ -74,16 +76,17 @@ def rotation_vec2mat(r):
     if theta > MAX_ANGLE:
         return np.eye(3)
     elif theta > SMALL_ANGLE:
-        n = r / theta
-        Sn = np.array([[0, -n[2], n[1]], [n[2], 0, -n[0]], [-n[1], n[0], 0]])
-        R = np.eye(3) + np.sin(theta) * Sn\
-            + (1 - np.cos(theta)) * np.dot(Sn, Sn)
+        s = np.sin(theta / 2) / theta
     else:
-        Sr = np.array([[0, -r[2], r[1]], [r[2], 0, -r[0]], [-r[1], r[0], 0]])
-        theta2 = theta * theta
-        R = np.eye(3) + (1 - theta2 / 6.) * Sr\
-            + (.5 - theta2 / 24.) * np.dot(Sr, Sr)
-    return R
+        s = .5 - theta * theta / 48.
+    a = np.cos(theta / 2)
+    b, c, d = s * r[0], s * r[1], s * r[2]
+    aa, bb, cc, dd = a * a, b * b, c * c, d * d
+    ab, ac, ad = a * b, a * c, a * d
+    bc, bd, cd = b * c, b * d, c * d
+    return np.array([[aa + bb - cc - dd, 2 * (bc - ad), 2 * (bd + ac)],
+                     [2 * (bc + ad), aa - bb + cc - dd, 2 * (cd - ab)],
+                     [2 * (bd - ac), 2 * (cd + ab), aa - bb - cc + dd]])
 
 
 def to_matrix44(t, dtype=np.double):
@@ -109,10 +112,10 @@ def to_matrix44(t, dtype=np.double):
     elif size == 7:
         T[0:3, 0:3] = t[6] * R
     else:
-        S = np.diag(np.exp(threshold(t[6:9], LOG_MAX_DIST)))
+        s = np.exp(threshold(t[6:9], LOG_MAX_DIST))
         Q = rotation_vec2mat(t[9:12])
-        # Beware: R*s*Q
-        T[0:3, 0:3] = np.dot(R, np.dot(S, Q))
+        # Beware: R*s*Q; diagonal s scales the rows of Q
+        T[0:3, 0:3] = np.dot(R, s[:, None] * Q)
     T[0:3, 3] = threshold(t[0:3], MAX_DIST)
     return T
 
@@ -210,7 +213,8 @@ class Affine(Transform):
         if array == None:
             self._vec12 = np.zeros(12)
             return
-        array = np.array(array)
+        # No copy here; the 12 vector is copied below, a 4x4 array only read
+        array = np.asarray(array)
         if array.size == 12:
             self._vec12 = array.ravel().copy()
         elif array.shape == (4, 4):
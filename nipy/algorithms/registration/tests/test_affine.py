@@ -4,7 +4,9 @@ import numpy as np
 
 from ..affine import (Affine, Affine2D, Rigid, Rigid2D,
                       Similarity, Similarity2D,
-                      rotation_mat2vec, subgrid_affine, slices2aff)
+                      rotation_mat2vec, rotation_vec2mat,
+                      subgrid_affine, slices2aff)
+from ....externals.transforms3d.quaternions import mat2quat, quat2mat
 
 from nose.tools import assert_true, assert_false, assert_raises
 from numpy.testing import assert_array_equal, assert_array_almost_equal
@@ -54,6 +56,43 @@ def test_rotation_mat2vec():
     assert_false(np.isnan(r).max())
 
 
+def test_rotation_from_scaled_matrix():
+    # Rigid and Similarity fit the rotation of matrices that are not
+    # orthogonal, as the eigenvector method does
+    R = rotation_vec2mat(np.array([0.1, -0.4, 0.7]))
+    shear = np.array([[1, 0.2, 0], [0, 1, 0.3], [0, 0, 1]])
+    for A in (np.dot(np.diag([2, 3, 4]), R), np.dot(R, np.diag([2, 3, 4]))):
+        aff = np.eye(4)
+        aff[:3, :3] = A
+        aff[:3, 3] = [3, -1, 2]
+        for klass in (Rigid, Similarity):
+            T = klass(aff)
+            assert_array_almost_equal(T.translation, [3, -1, 2])
+            assert_array_almost_equal(rotation_vec2mat(T.rotation), R)
+    # With shear, the rotation is the eigenvector method fit
+    for A in (np.dot(R, shear), 3 * np.dot(R, shear)):
+        aff = np.eye(4)
+        aff[:3, :3] = A
+        R_eig = quat2mat(mat2quat(A))
+        for klass in (Rigid, Similarity):
+            T = klass(aff)
+            assert_array_almost_equal(rotation_vec2mat(T.rotation), R_eig)
+
+
+def test_rotation_vec2mat():
+    # Check closed form against Rodrigues formula
+    for i in range(20):
+        r = np.random.normal(size=3)
+        theta = np.sqrt(np.sum(r ** 2))
+        n = r / theta
+        Sn = np.array([[0, -n[2], n[1]], [n[2], 0, -n[0]], [-n[1], n[0], 0]])
+        R = np.eye(3) + np.sin(theta) * Sn\
+            + (1 - np.cos(theta)) * np.dot(Sn, Sn)
+        assert_array_almost_equal(rotation_vec2mat(r), R)
+        assert_array_almost_equal(rotation_vec2mat(rotation_mat2vec(R)), R)
+    assert_array_equal(rotation_vec2mat(np.zeros(3)), np.eye(3))
+
+
 def test_composed_affines():
     aff1 = np.diag([2, 3, 4, 1])
     aff2 = np.eye(4)
@@ -272,12 +272,11 @@ class Image(object):
         elif type(order[0]) == type(''):
             order = [self.axes.index(s) for s in order]
         new_cmap = self.coordmap.reordered_domain(order)
-        # Only transpose if we have to so as to avoid calling
-        # self.get_data
+        # Only transpose if we have to; otherwise share this image's data
         if order != range(self.ndim):
             new_data = np.transpose(self.get_data(), order)
         else:
-            new_data = self._data
+            new_data = None
         return self.__class__.from_image(self,
                                          data=new_data,
                                          coordmap=new_cmap)
@@ -340,7 +339,7 @@ class Image(object):
                       "``img.get_data()[x]  = y`` instead",
                       DeprecationWarning,
                       stacklevel=2)
-        self._data[index] = value
+        self.get_data()[index] = value
 
     def __array__(self):
         """Return data as a numpy array."""
@@ -350,8 +349,15 @@ class Image(object):
         return self.get_data()
 
     def get_data(self):
-        """Return data as a numpy array."""
-        return np.asanyarray(self._data)
+        """Return data as a numpy array.
+
+        If the image data is an array-like object such as an array proxy, we
+        read it into an array on the first call, and keep the array for
+        subsequent calls.
+        """
+        if not isinstance(self._data, np.ndarray):
+            self._data = np.asanyarray(self._data)
+        return self._data
 
     def __getitem__(self, slice_object):
         """ Slicing an image returns an Image.
@@ -410,7 +416,7 @@ class Image(object):
         np.set_printoptions(precision=6, threshold=64, edgeitems=2)
         representation = \
             'Image(\n  data=%s,\n  coordmap=%s)' % (
-            '\n       '.join(repr(self._data).split('\n')),
+            '\n       '.join(repr(self.get_data()).split('\n')),
             '\n         '.join(repr(self.coordmap).split('\n')))
         np.set_printoptions(**options)
         return representation
@@ -452,7 +458,8 @@ class Image(object):
         >>> img = Image.from_image(aimg, data=arr)
         """
         if data is None:
-            data = img._data
+            # Read any array proxy once, so both images share the one array
+            data = img.get_data()
         if coordmap is None:
             coordmap = copy(img.coordmap)
         if metadata is None:
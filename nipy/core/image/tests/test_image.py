@@ -176,6 +176,38 @@ def test_ArrayLikeObj():
     assert_array_equal(img.get_data(), 4)
 
 
+class ProxyLikeObj(object):
+    """ Array-like object returning a new array on each read """
+    def __init__(self):
+        self.n_reads = 0
+
+    @property
+    def shape(self):
+        return (2, 3, 4)
+
+    def __array__(self):
+        self.n_reads += 1
+        return np.ones(self.shape)
+
+
+def test_derived_share_data():
+    # Images derived from an image with array proxy data share one array
+    obj = ProxyLikeObj()
+    coordmap = AffineTransform.from_params('ijk', 'xyz', np.eye(4))
+    img = image.Image(obj, coordmap)
+    derived = [Image.from_image(img),
+               img.reordered_axes([0, 1, 2]),
+               img.renamed_axes(i='slice')]
+    arr = img.get_data()
+    for d_img in derived:
+        assert_true(d_img.get_data() is arr)
+    assert_equal(obj.n_reads, 1)
+    # In-place edits show in all images
+    derived[0].get_data()[:] = 4
+    assert_array_equal(img.get_data(), 4)
+    assert_array_equal(derived[1].get_data(), 4)
+
+
 def test_defaults_ND():
     for arr_shape, in_names, out_names in (
         ((2,3), 'kj', 'yz'),
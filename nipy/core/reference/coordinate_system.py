@@ -14,6 +14,13 @@ __docformat__ = 'restructuredtext'
 
 import numpy as np
 
+# Scalar types allowed for coordinates
+_SCTYPES = (np.sctypes['int'] + np.sctypes['float'] +
+            np.sctypes['complex'] + np.sctypes['uint'] + [np.object])
+# Hashed set of the equivalent dtypes for fast checking
+_VALID_DTYPES = frozenset(np.dtype(t) for t in _SCTYPES)
+
+
 class CoordinateSystemError(Exception):
     pass
 
@@ -113,11 +120,9 @@ class CoordinateSystem(object):
         if len(set(coord_names)) != len(coord_names):
             raise ValueError('coord_names must have distinct names')
         # verify that the dtype is coord_dtype for sanity
-        sctypes = (np.sctypes['int'] + np.sctypes['float'] +
-                   np.sctypes['complex'] + np.sctypes['uint'] + [np.object])
         coord_dtype = np.dtype(coord_dtype)
-        if coord_dtype not in sctypes:
-            raise ValueError('Coordinate dtype should be one of %s' % sctypes)
+        if coord_dtype not in _VALID_DTYPES:
+            raise ValueError('Coordinate dtype should be one of %s' % _SCTYPES)
         # Set all the attributes
         self.name = name
         self.coord_names = coord_names
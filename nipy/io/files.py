@@ -16,6 +16,7 @@ import os
 import numpy as np
 
 import nibabel as nib
+from nibabel.fileholders import FileHolder
 from nibabel.spatialimages import HeaderDataError
 
 from ..core.image.image import is_image
@@ -25,12 +26,15 @@ from .nibcompat import get_dataobj, get_affine, get_header
 
 
 def load(filename):
-    """Load an image from the given filename.
+    """Load an image from the given filename or file-like object.
 
     Parameters
     ----------
-    filename : string
-        Should resolve to a complete filename path.
+    filename : string or file-like
+        Should resolve to a complete filename path, or be a file-like object
+        containing a single file NIfTI image (header and data together).  The
+        image data is read when first needed, so a file-like object should
+        stay open until then.
 
     Returns
     -------
@@ -50,9 +54,12 @@ def load(filename):
     >>> img.shape
     (33, 41, 25)
     """
-    if filename.endswith('.mnc'):
+    if hasattr(filename, 'read'):
+        img = _load_fileobj(filename)
+    elif filename.endswith('.mnc'):
         raise ValueError("Sorry, we can't get the MINC axis names right yet")
-    img = nib.load(filename)
+    else:
+        img = nib.load(filename)
     # Deal with older nibabel
     ni_img = nib.Nifti1Image(get_dataobj(img),
                              get_affine(img),
@@ -60,6 +67,13 @@ def load(filename):
     return nifti2nipy(ni_img)
 
 
+def _load_fileobj(fileobj):
+    """ Load single file NIfTI image from file-like object `fileobj`
+    """
+    holder = FileHolder(fileobj=fileobj)
+    return nib.Nifti1Image.from_file_map({'header': holder, 'image': holder})
+
+
 def save(img, filename, dtype_from='data'):
     """Write the image to a file.
 
@@ -14,7 +14,10 @@ The equivalents for these older versions of nibabel are:
 
 With old nibabel, getting unscaled data used `read_img_data(img,
 prefer="unscaled").  Newer nibabel should prefer the `get_unscaled` method on
-the image proxy object
+the image proxy object.
+
+``get_scaled_data`` applies the image scaling to the unscaled data in place,
+optionally into an array passed by the caller.
 """
 
 import numpy as np
@@ -98,3 +101,51 @@ def get_unscaled_data(img):
         except AttributeError:
             return np.array(img.dataobj)
     return nib.loadsave.read_img_data(img, prefer='unscaled')
+
+
+def get_scaled_data(img, out=None):
+    """ Get the data from a nibabel image, applying scaling in place
+
+    Parameters
+    ----------
+    img : ``SpatialImage`` instance
+        Instance of nibabel ``SpatialImage`` class
+    out : None or ndarray, optional
+        Array in which to place the scaled data.  It must have the same shape
+        as `img`.  Passing the same `out` array for a series of images avoids
+        allocating a new array for each one.
+
+    Returns
+    -------
+    data : ndarray
+        Scaled data.  This is `out` if `out` is not None.  Otherwise, for
+        images without scaling, it is the unscaled data as loaded from the
+        image, and for scaled images, a new floating point array with the
+        precision of the on-disk data, but at least float32.  Data is always
+        returned in native byte order.
+    """
+    data = get_unscaled_data(img)
+    try:
+        # Newer nibabel proxies store the scaling read from the header
+        dataobj = get_dataobj(img)
+        slope, inter = dataobj.slope, dataobj.inter
+    except AttributeError:
+        slope, inter = get_header(img).get_slope_inter()
+    slope = 1.0 if slope is None else slope
+    inter = 0.0 if inter is None else inter
+    if slope == 1.0 and inter == 0.0:
+        if out is None:
+            if data.dtype.isnative:
+                return data
+            # Swap bytes in one pass, leaving any memmap untouched
+            return data.byteswap().view(data.dtype.newbyteorder('='))
+        out[...] = data
+        return out
+    if out is None:
+        out = np.empty(data.shape,
+                       dtype=np.promote_types(data.dtype, np.float32))
+    # The ufunc swaps any non-native bytes while scaling, in the same pass
+    np.multiply(data, slope, out)
+    if inter != 0.0:
+        np.add(out, inter, out)
+    return out
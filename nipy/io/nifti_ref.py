@@ -130,22 +130,19 @@ For loading a NIFTI image to NIPY, see the docstring for :func:`nifti2nipy`.
 import sys
 
 import warnings
-from copy import copy
 
 import numpy as np
 
 import nibabel as nib
-from nibabel.affines import to_matvec, from_matvec
+from nibabel.affines import to_matvec
 
 from ..core.reference.coordinate_system import CoordinateSystem as CS
-from ..core.reference.coordinate_map import (AffineTransform as AT,
-                                             axmap,
-                                             product as cm_product)
+from ..core.reference.coordinate_map import AffineTransform as AT, axmap
 from ..core.reference import spaces as ncrs
 from ..core.image.image import Image
 from ..core.image.image_spaces import as_xyz_image
 
-from .nibcompat import get_header, get_affine
+from .nibcompat import get_dataobj, get_header, get_affine
 
 
 XFORM2SPACE = {'scanner': ncrs.scanner_space,
@@ -170,6 +167,9 @@ for _name, _info in TIME_LIKE_AXES.items():
 
 TIME_LIKE_ORDERED = ('t', 'hz', 'ppm', 'rads')
 
+# Simple spatial names accepted in addition to known names when not strict
+SIMPLE_XYZ_NAMES = dict(x='x', y='y', z='z')
+
 # Threshold for near-zero affine values
 TINY = 1e-5
 
@@ -277,9 +277,7 @@ def nipy2nifti(img, data_dtype=None, strict=None, fix0=True):
         strict = False
     known_names = ncrs.known_names
     if not strict: # add simple 'xyz' to acceptable spatial names
-        known_names = copy(known_names) # copy module global dict
-        for c in 'xyz':
-            known_names[c] = c
+        known_names = dict(known_names, **SIMPLE_XYZ_NAMES)
     try:
         img = as_xyz_image(img, known_names)
     except (ncrs.AxesError, ncrs.AffineError):
@@ -357,17 +355,17 @@ def nipy2nifti(img, data_dtype=None, strict=None, fix0=True):
     hdr.set_dim_info(*dim_infos)
     # Set units without knowing time
     hdr.set_xyzt_units(xyz='mm')
-    # Done if we only have 3 input dimensions
+    # Number of non-spatial dimensions
     n_ns = coordmap.ndims[0] - 3
-    if n_ns == 0: # No non-spatial dimensions
-        return nib.Nifti1Image(img.get_data(), xyz_affine, hdr)
-    elif n_ns > 4:
+    if n_ns > 4:
         raise NiftiError("Too many dimensions to convert")
     # Go now to data, pixdims
     if data is None:
         data = img.get_data()
-    rzs, trans = to_matvec(img.coordmap.affine)
-    ns_pixdims = list(np.sqrt(np.sum(rzs[3:, 3:] ** 2, axis=0)))
+    # Done if we only have 3 input dimensions
+    if n_ns == 0:
+        return nib.Nifti1Image(data, xyz_affine, hdr)
+    ns_pixdims = np.sqrt(np.sum(rzs[3:, 3:] ** 2, axis=0))
     in_ax, out_ax, tl_name = _find_time_like(coordmap, fix0)
     if in_ax is None: # No time-like axes
         # add new 1-length axis
@@ -378,7 +376,7 @@ def nipy2nifti(img, data_dtype=None, strict=None, fix0=True):
         # xyzt_units
         hdr.set_xyzt_units(xyz='mm')
         # shift pixdims
-        ns_pixdims.insert(0, 0)
+        ns_pixdims = np.r_[0, ns_pixdims]
     else: # Time-like
         hdr.set_xyzt_units(xyz='mm', t=TIME_LIKE_AXES[tl_name]['units'])
         # If this is really time, set toffset
@@ -393,7 +391,7 @@ def nipy2nifti(img, data_dtype=None, strict=None, fix0=True):
             order = range(n_ns)
             order.pop(in_ax - 3)
             order.insert(0, in_ax - 3)
-            ns_pixdims = [ns_pixdims[i] for i in order]
+            ns_pixdims = ns_pixdims[order]
     hdr['pixdim'][4:(4 + n_ns)] = ns_pixdims
     return nib.Nifti1Image(data, xyz_affine, hdr)
 
@@ -542,7 +540,8 @@ def nifti2nipy(ni_img):
         affine = hdr.get_best_affine()
     else:
         affine = affine.copy()
-    data = ni_img.get_data()
+    # Keep any array proxy so the data is only read when needed
+    data = get_dataobj(ni_img)
     shape = list(ni_img.shape)
     ndim = len(shape)
     if ndim < 3:
@@ -579,24 +578,27 @@ def nifti2nipy(ni_img):
             affine[:3] /= 1000.
         elif space_units == 'meter':
             affine[:3] *= 1000.
-    input_cs3 = CS(input_names3, name='voxels')
-    output_cs3 = world_space.to_coordsys_maker()(3)
-    cmap3 = AT(input_cs3, output_cs3, affine)
     if ndim == 3:
+        cmap3 = AT(CS(input_names3, name='voxels'),
+                   world_space.to_coordsys_maker()(3),
+                   affine)
         return Image(data, cmap3, {'header': hdr})
     space_units, time_like_units = hdr.get_xyzt_units()
     units_info = TIME_LIKE_UNITS.get(time_like_units, None)
     n_ns = ndim - 3
-    ns_zooms = list(hdr.get_zooms()[3:])
-    ns_trans = [0] * n_ns
+    ns_zooms = np.array(hdr.get_zooms()[3:], dtype=np.float64)
+    ns_trans = np.zeros(n_ns)
     ns_names = tuple('uvw')
     # Have we got a time axis?
     if (shape[3] == 1 and ndim > 4 and units_info is None):
         # Squeeze length 1 no-time axis
         shape.pop(3)
-        ns_zooms.pop(0)
-        ns_trans.pop(0)
-        data = data.reshape(shape)
+        ns_zooms = ns_zooms[1:]
+        ns_trans = ns_trans[1:]
+        try:
+            data = data.reshape(shape)
+        except AttributeError: # array proxy without reshape method
+            data = np.asanyarray(data).reshape(shape)
         n_ns -= 1
     else: # have time-like
         if units_info is None:
@@ -608,11 +610,16 @@ def nifti2nipy(ni_img):
             # Get time offset
             ns_trans[0] = hdr['toffset']
         ns_names = (time_name,) + ns_names
-    output_cs = CS(ns_names[:n_ns])
-    input_cs = CS(ns_names[:n_ns])
-    aff = from_matvec(np.diag(ns_zooms), ns_trans)
-    ns_cmap = AT(input_cs, output_cs, aff)
-    cmap = cm_product(cmap3, ns_cmap,
-                      input_name=cmap3.function_domain.name,
-                      output_name=cmap3.function_range.name)
+    # Fill N-D affine directly from XYZ affine and non-spatial zooms, offsets
+    ns_names = ns_names[:n_ns]
+    ndim = 3 + n_ns
+    ns_inds = np.arange(3, ndim)
+    full_aff = np.eye(ndim + 1)
+    full_aff[:3, :3] = affine[:3, :3]
+    full_aff[:3, -1] = affine[:3, 3]
+    full_aff[ns_inds, ns_inds] = ns_zooms
+    full_aff[3:ndim, -1] = ns_trans
+    cmap = AT(CS(input_names3 + list(ns_names), name='voxels'),
+              world_space.to_coordsys_maker(ns_names)(ndim),
+              full_aff)
     return Image(data, cmap, {'header': hdr})
@@ -1,6 +1,7 @@
 # emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
 # vi: set ft=python sts=4 ts=4 sw=4 et:
 from os.path import dirname, join as pjoin
+from io import BytesIO
 
 import numpy as np
 
@@ -236,6 +237,21 @@ def test_file_roundtrip():
     assert_almost_equal(img2.affine, img.affine)
 
 
+def test_fileobj_load():
+    img = load_image(anatfile)
+    with InTemporaryDirectory():
+        save_image(img, 'img.nii')
+        with open('img.nii', 'rb') as fobj:
+            bio = BytesIO(fobj.read())
+        img2 = load_image('img.nii')
+        data2 = img2.get_data().copy() # copy to detach from file
+        del img2
+    img3 = load_image(bio)
+    assert_array_equal(img3.get_data(), data2)
+    assert_array_equal(img3.affine, img.affine)
+    assert_equal(img3.coordmap, img.coordmap)
+
+
 def test_roundtrip_from_array():
     data = np.random.rand(10,20,30)
     img = Image(data, AfT('kji', 'xyz', np.eye(4)))
@@ -7,7 +7,7 @@ import nibabel as nib
 from nibabel.tmpdirs import InTemporaryDirectory
 
 from ..nibcompat import (get_dataobj, get_affine, get_header,
-                         get_unscaled_data)
+                         get_unscaled_data, get_scaled_data)
 
 from numpy.testing import assert_array_equal
 
@@ -64,3 +64,74 @@ def test_unscaled_data():
             assert_true(np.allclose(unscaled * slope + inter, data_back))
             # delete objects to allow file deletion on Windows
             del raw_back, unscaled
+
+
+def test_scaled_data():
+    shape = (2, 3, 4)
+    data = np.random.normal(size=shape)
+    # In-memory image, no proxy
+    img = nib.Nifti1Image(data, np.eye(4))
+    assert_array_equal(get_scaled_data(img), data)
+    with InTemporaryDirectory():
+        # Scaled integer image
+        img = nib.Nifti1Image(data, np.eye(4))
+        img.set_data_dtype(np.dtype(np.int16))
+        nib.save(img, 'test.nii')
+        img_back = nib.load('test.nii')
+        data_back = np.array(get_dataobj(img_back))
+        scaled = get_scaled_data(img_back)
+        assert_equal(scaled.dtype, np.dtype(np.float32))
+        assert_true(np.allclose(scaled, data_back))
+        # Scaling into passed array
+        out = np.zeros(shape)
+        res = get_scaled_data(img_back, out=out)
+        assert_true(res is out)
+        assert_true(np.allclose(out, data_back))
+        # Unscaled float image returns the data as loaded
+        img = nib.Nifti1Image(data.astype(np.float32), np.eye(4))
+        nib.save(img, 'test_f.nii')
+        img_back = nib.load('test_f.nii')
+        unscaled = get_scaled_data(img_back)
+        assert_array_equal(unscaled, data.astype(np.float32))
+        out = np.zeros(shape)
+        res = get_scaled_data(img_back, out=out)
+        assert_true(res is out)
+        assert_array_equal(out, data.astype(np.float32))
+        del img_back, unscaled, scaled, data_back
+
+
+def test_scaled_data_swapped():
+    shape = (2, 3, 4)
+    data = np.random.normal(size=shape) * 100
+    with InTemporaryDirectory():
+        for endianness in '<>':
+            for dtype in (np.float32, np.float64, np.int16):
+                hdr = nib.Nifti1Header(endianness=endianness)
+                hdr.set_data_dtype(dtype)
+                img = nib.Nifti1Image(data.astype(dtype), np.eye(4), hdr)
+                nib.save(img, 'test.nii')
+                img_back = nib.load('test.nii')
+                data_back = np.array(get_dataobj(img_back))
+                res = get_scaled_data(img_back)
+                assert_true(res.dtype.isnative)
+                assert_array_equal(res, data_back)
+                del img_back, data_back, res
+        # Swapped integer data with scaling, swapped while scaling
+        hdr = nib.Nifti1Header(endianness='>')
+        hdr.set_data_dtype(np.int16)
+        img = nib.Nifti1Image(data + 1000, np.eye(4), hdr)
+        nib.save(img, 'test_scaled.nii')
+        img_back = nib.load('test_scaled.nii')
+        dao = get_dataobj(img_back)
+        assert_false(get_header(img_back).get_data_dtype().isnative)
+        assert_not_equal(dao.slope, 1)
+        assert_not_equal(dao.inter, 0)
+        data_back = np.array(dao)
+        res = get_scaled_data(img_back)
+        assert_true(res.dtype.isnative)
+        assert_true(np.allclose(res, data_back))
+        out = np.zeros(shape)
+        res = get_scaled_data(img_back, out=out)
+        assert_true(res is out)
+        assert_true(np.allclose(out, data_back))
+        del img_back, dao, data_back, res
@@ -12,6 +12,7 @@ import numpy as np
 import nibabel as nib
 from nibabel.affines import from_matvec
 from nibabel.spatialimages import HeaderDataError
+from nibabel.tmpdirs import InTemporaryDirectory
 
 from ...core.api import (Image,
                          AffineTransform as AT,
@@ -22,7 +23,7 @@ from ...core.reference.spaces import (unknown_csm, scanner_csm, aligned_csm,
 
 from ..files import load
 from ..nifti_ref import (nipy2nifti, nifti2nipy, NiftiError)
-from ..nibcompat import get_header, get_affine
+from ..nibcompat import get_dataobj, get_header, get_affine
 
 from nose.tools import assert_equal, assert_true, assert_false, assert_raises
 from numpy.testing import assert_almost_equal, assert_array_equal
@@ -495,6 +496,25 @@ def test_basic_load():
     assert_array_equal(img.get_data(), data)
 
 
+def test_lazy_load():
+    # Data is not read from file until asked for
+    data = np.random.normal(size=(2, 3, 4, 5))
+    aff = np.diag([2., 3, 4, 1])
+    with InTemporaryDirectory():
+        nib.save(nib.Nifti1Image(data, aff), 'test.nii')
+        ni_img = nib.load('test.nii')
+        img = nifti2nipy(ni_img)
+        assert_true(img._data is get_dataobj(ni_img))
+        # repr shows the data, not the proxy
+        rep = repr(img)
+        assert_equal(rep, repr(Image(img.get_data(), img.coordmap)))
+        arr = img.get_data()
+        assert_array_equal(arr, data)
+        # Data array kept after first read
+        assert_true(img.get_data() is arr)
+        del img, arr
+
+
 def test_expand_to_3d():
     # Test 1D and 2D niftis
     # 1D and 2D with full sform or qform affines raise a NiftiError, because we
@@ -103,8 +103,11 @@ def save(filename, obj):
     """
     obj = as_volume_img(obj, copy=False)
     hdr = nib.Nifti1Header()
+    # The header fields are the names of its record dtype; get these once
+    # rather than scanning the header for each metadata key
+    hdr_fields = set(hdr.keys())
     for key, value in obj.metadata.iteritems():
-        if key in hdr:
+        if key in hdr_fields:
             hdr[key] = value
     img = nib.Nifti1Image(obj.get_data(), 
                                    obj.affine,
@@ -12,7 +12,8 @@ from scipy import ndimage
 # Neuroimaging libraries imports
 from nibabel import load, nifti1, save
 
-from ..io.nibcompat import get_header, get_affine, get_unscaled_data
+from ..io.nibcompat import (get_header, get_affine, get_unscaled_data,
+                            get_scaled_data)
 
 ###############################################################################
 # Operating on connect component
@@ -152,6 +153,7 @@ def compute_mask_files(input_filename, output_filename=None,
         # We do not use the unscaled data here?:
         # if the scalefactor is being used to record real
         # differences in intensity over the run this would break
+        vol_buffer = None
         for index, filename in enumerate(input_filename):
             nim = load(filename)
             if index == 0:
@@ -160,7 +162,10 @@ def compute_mask_files(input_filename, output_filename=None,
                 header = get_header(nim)
                 affine = get_affine(nim)
             else:
-                mean_volume += nim.get_data().squeeze()
+                # Re-use one buffer while the image shape stays the same
+                if vol_buffer is None or vol_buffer.shape != nim.shape:
+                    vol_buffer = np.empty(nim.shape, dtype=np.float32)
+                mean_volume += get_scaled_data(nim, out=vol_buffer).squeeze()
         mean_volume /= float(len(list(input_filename)))
     del nim
     if np.isnan(mean_volume).any():
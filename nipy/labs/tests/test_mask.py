@@ -15,7 +15,7 @@ from .. import mask as nnm
 from ..mask import (largest_cc, threshold_connect_components, series_from_mask)
 
 from nipy.testing import (assert_equal, assert_true, assert_array_equal,
-                          anatfile, assert_false)
+                          anatfile, assert_false, assert_array_almost_equal)
 
 
 def test_largest_cc():
@@ -83,6 +83,15 @@ def test_mask_files():
                                              return_mean=True)
         assert_array_equal(msk1, msk2)
         assert_array_equal(mean1, mean2)
+        # List mixing 3D files and 4D files with one volume
+        img = nib.Nifti1Image(arr[..., None], np.eye(4))
+        nib.save(img, 'fourd1_anat.nii')
+        msk3, mean3 = nnm.compute_mask_files(
+            [anatfile, 'fourd1_anat.nii', anatfile, 'fourd1_anat.nii'],
+            return_mean=True)
+        assert_array_equal(msk3, msk2)
+        assert_array_almost_equal(mean3, mean2)
+        del img
 
 
 def test_series_from_mask():
@@ -3,6 +3,7 @@
 from .routines import (quantile, median, mahalanobis, svd, permutations,
                        combinations, gamln, psi)
 from .zscore import zscore
+from .loading import load_many
 
 from nipy.testing import Tester
 test = Tester().test
@@ -0,0 +1,39 @@
+# emacs: -*- mode: python; py-indent-offset: 4; indent-tabs-mode: nil -*-
+# vi: set ft=python sts=4 ts=4 sw=4 et:
+"""
+Loading many images at once.
+"""
+from multiprocessing.pool import ThreadPool
+
+from nibabel import load
+
+
+def load_many(paths, n_workers=None):
+    """ Load images from a sequence of filenames using a pool of threads
+
+    Parameters
+    ----------
+    paths : sequence of str
+        Image filenames.
+    n_workers : None or int, optional
+        Number of threads.  None (default) means the number of CPUs.
+
+    Returns
+    -------
+    imgs : list
+        nibabel images, in the same order as `paths`.
+
+    Notes
+    -----
+    Loading reads the image headers; the image data is only read when first
+    accessed.  Header reads mostly wait on the disk, which releases the GIL,
+    so threads can overlap them.  Decompressing data from ``.gz`` files is
+    CPU bound and holds the GIL, so use processes rather than threads to
+    parallelize work on compressed image data.
+    """
+    pool = ThreadPool(n_workers)
+    try:
+        return pool.map(load, paths)
+    finally:
+        pool.close()
+        pool.join()
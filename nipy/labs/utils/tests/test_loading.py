@@ -0,0 +1,30 @@
+""" Testing loading of many images
+"""
+import numpy as np
+
+import nibabel as nib
+from nibabel.tmpdirs import InTemporaryDirectory
+
+from ..loading import load_many
+
+from nose.tools import assert_equal
+from numpy.testing import assert_array_equal
+
+
+def test_load_many():
+    shape = (2, 3, 4)
+    with InTemporaryDirectory():
+        fnames = []
+        datas = []
+        for i in range(5):
+            data = np.random.normal(size=shape).astype(np.float32)
+            fname = 'img%d.nii' % i
+            nib.save(nib.Nifti1Image(data, np.eye(4)), fname)
+            fnames.append(fname)
+            datas.append(data)
+        for n_workers in (None, 1, 3):
+            imgs = load_many(fnames, n_workers)
+            assert_equal(len(imgs), len(fnames))
+            for img, data in zip(imgs, datas):
+                assert_array_equal(img.get_data(), data)
+            del imgs, img